@@ -1,79 +1,107 @@
 import json
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional
 
 import numpy as np
+import pandas as pd
 
+try:
+    import orjson  # type: ignore
+except Exception:  # orjson optional
+    orjson = None  # type: ignore
 
-def create_sample_json_data(minutes: int = 60, seed: Optional[int] = 2024) -> dict:
+from schema import ACTIVE_HOURS, JSON_SECTIONS, JSONL_SUFFIXES, SLEEP_STAGES, Dataset
+
+
+def create_sample_json_data(minutes: int = 60, seed: Optional[int] = 2024) -> Dict[str, Dataset]:
     """Create in-memory sample fitness data for heart rate, steps, and sleep.
 
-    Structure:
+    Each section is column-oriented (column name -> NumPy array):
     {
-      "heart_rate_data": [ {timestamp, bpm, confidence}, ... ],
-      "step_data": [ {timestamp, steps, cadence}, ... ],
-      "sleep_data": [ {timestamp, stage, duration_min}, ... ]
+      "heart_rate_data": {timestamp, bpm, confidence},
+      "step_data": {timestamp, steps, cadence},
+      "sleep_data": {timestamp, stage, duration_min}
     }
     """
     rng = np.random.default_rng(seed)
-    data = {"heart_rate_data": [], "step_data": [], "sleep_data": []}
 
     # Start of the day at 08:00 for HR and Steps
     start_time = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+    idx = np.arange(minutes)
+    ts_index = pd.date_range(start=start_time, periods=minutes, freq="1min")
+    timestamps = ts_index.strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
 
     # Heart rate data (per minute)
-    for i in range(minutes):
-        ts = start_time + timedelta(minutes=i)
-        baseline = 70 + 6 * np.sin(i / 12)
-        noise = rng.normal(0, 4)
-        hr = int(max(48, min(180, baseline + noise)))
-        data["heart_rate_data"].append({
-            "timestamp": ts.isoformat(),
-            "bpm": hr,
-            "confidence": float(rng.uniform(0.8, 1.0)),
-        })
+    baseline = 70 + 6 * np.sin(idx / 12)
+    noise = rng.normal(0, 4, minutes)
+    hr = np.clip(baseline + noise, 48, 180).astype(np.int16)
+    conf = rng.uniform(0.8, 1.0, minutes)
 
     # Step data (per minute)
-    for i in range(minutes):
-        ts = start_time + timedelta(minutes=i)
-        hour = ts.hour
-        lam = 2
-        if 8 <= hour < 10 or 12 <= hour < 14 or 17 <= hour < 19:
-            lam = 18
-        steps = int(rng.poisson(lam))
-        data["step_data"].append({
-            "timestamp": ts.isoformat(),
-            "steps": steps,
-            "cadence": steps if steps > 0 else 0,
-        })
+    hours = ts_index.hour.to_numpy()
+    lam = np.full(minutes, 2)
+    lam[np.isin(hours, ACTIVE_HOURS)] = 18
+    steps = rng.poisson(lam).astype(np.int16)
+    cadence = np.where(steps > 0, steps, 0)
 
     # Sleep data (5-minute intervals over ~7 hours)
     sleep_start = (datetime.now().replace(hour=23, minute=0, second=0, microsecond=0)
                    - timedelta(days=1))
     interval = 5
     n = int((7 * 60) / interval)
-    stages = ["awake", "light", "deep", "REM"]
     probs = np.array([0.06, 0.54, 0.25, 0.15])
-    for i in range(n):
-        ts = sleep_start + timedelta(minutes=i * interval)
-        stage = rng.choice(stages, p=probs)
-        data["sleep_data"].append({
-            "timestamp": ts.isoformat(),
-            "stage": str(stage),
-            "duration_min": interval,
-        })
+    sleep_index = pd.date_range(start=sleep_start, periods=n, freq=f"{interval}min")
+    stage_vals = rng.choice(SLEEP_STAGES, size=n, p=probs)
+
+    return {
+        "heart_rate_data": {"timestamp": timestamps, "bpm": hr, "confidence": conf},
+        "step_data": {"timestamp": timestamps, "steps": steps, "cadence": cadence},
+        "sleep_data": {
+            "timestamp": sleep_index.strftime("%Y-%m-%dT%H:%M:%S").to_numpy(),
+            "stage": stage_vals,
+            "duration_min": np.full(n, interval, dtype=np.int16),
+        },
+    }
+
 
-    return data
+def _records(columns: Dataset) -> List[dict]:
+    """Turn a column-oriented section back into the on-disk list of records."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(col.tolist() for col in columns.values()))]
+
+
+def _write_jsonl(file_path: str, data: Dict[str, Dataset]) -> None:
+    """Write one record per line, tagged with a 'kind' field naming its dataset."""
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj):
+            return json.dumps(obj).encode("utf-8")
+    with open(file_path, "wb") as f:
+        for kind, section in JSON_SECTIONS.items():
+            f.writelines(dumps({"kind": kind, **r}) + b"\n" for r in _records(data[section]))
 
 
 def write_sample_json(file_path: str = "sample_data.json", minutes: int = 60) -> str:
+    """Write sample data to `file_path`.
+
+    '.jsonl'/'.ndjson' paths get JSON Lines (one record per line with a 'kind'
+    field), any other path the legacy single JSON object.
+    """
     data = create_sample_json_data(minutes=minutes)
+    if file_path.endswith(JSONL_SUFFIXES):
+        _write_jsonl(file_path, data)
+        return file_path
+    blob = {section: _records(columns) for section, columns in data.items()}
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(blob, option=orjson.OPT_INDENT_2))
+        return file_path
     with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+        json.dump(blob, f, indent=2)
     return file_path
 
 
 if __name__ == "__main__":
     path = write_sample_json()
     print(f"Created sample JSON at: {path}")
-
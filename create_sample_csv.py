@@ -5,11 +5,80 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+except Exception:  # pyarrow optional
+    pa = None  # type: ignore
+
+from schema import ACTIVE_HOURS, SLEEP_STAGES
+
 
 def _ensure_dir(path: str) -> None:
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
 
+def _write_csv(file_path: str, columns: dict) -> None:
+    """Write a dict of equal-length columns to CSV.
+
+    Uses pyarrow's multi-threaded writer when available, otherwise pandas.
+    """
+    _ensure_dir(file_path)
+    if pa is not None:
+        table = pa.Table.from_pydict(columns)
+        # Values never need quoting here; 'none' keeps output identical to pandas.
+        # The header is written by hand because pyarrow always quotes it.
+        options = pacsv.WriteOptions(include_header=False, batch_size=8192, quoting_style="none")
+        with open(file_path, "wb") as f:
+            f.write((",".join(columns) + "\n").encode("utf-8"))
+            pacsv.write_csv(table, f, write_options=options)
+        return
+    pd.DataFrame(columns).to_csv(file_path, index=False)
+
+
+def _synthesize_hr_loop(noise, mean, amplitude, period, lo, hi):
+    """Sinusoidal baseline + noise, clamped to [lo, hi] and truncated to int16.
+
+    Written as a single per-sample loop so numba can compile it; this is the
+    place to add per-step state (e.g. AR(1) noise) later.
+    """
+    out = np.empty(noise.shape[0], dtype=np.int16)
+    for i in range(noise.shape[0]):
+        v = mean + amplitude * np.sin(i / period) + noise[i]
+        if v < lo:
+            v = lo
+        elif v > hi:
+            v = hi
+        out[i] = int(v)
+    return out
+
+
+def _synthesize_hr_numpy(noise, mean, amplitude, period, lo, hi):
+    """Vectorized equivalent of _synthesize_hr_loop for short series or without numba."""
+    baseline = mean + amplitude * np.sin(np.arange(noise.shape[0]) / period)
+    return np.clip(baseline + noise, lo, hi).astype(np.int16)
+
+
+# Importing numba and loading the compiled loop costs ~0.7s, which only pays
+# off on very long series (~20M samples, decades of minutes)
+_JIT_MIN_SAMPLES = 20_000_000
+_jit_hr = None
+
+
+def _synthesize_hr(noise, mean, amplitude, period, lo, hi):
+    """Run _synthesize_hr_loop under numba for large inputs, NumPy otherwise."""
+    global _jit_hr
+    if noise.shape[0] < _JIT_MIN_SAMPLES:
+        return _synthesize_hr_numpy(noise, mean, amplitude, period, lo, hi)
+    if _jit_hr is None:
+        try:
+            from numba import njit  # type: ignore
+            _jit_hr = njit(cache=True)(_synthesize_hr_loop)
+        except Exception:  # numba optional
+            _jit_hr = _synthesize_hr_numpy
+    return _jit_hr(noise, mean, amplitude, period, lo, hi)
+
+
 def create_heart_rate_csv(file_path: str, minutes: int = 180, seed: Optional[int] = 42) -> str:
     """Create a sample heart rate CSV with per-minute readings.
 
@@ -17,25 +86,17 @@ def create_heart_rate_csv(file_path: str, minutes: int = 180, seed: Optional[int
     """
     rng = np.random.default_rng(seed)
     start_time = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
-    timestamps = []
-    heart_rates = []
-
-    for i in range(minutes):
-        ts = start_time + timedelta(minutes=i)
-        # Baseline + mild sinusoidal variation + noise
-        baseline = 72 + 8 * np.sin(i / 15)
-        noise = rng.normal(0, 3)
-        hr = int(max(48, min(180, baseline + noise)))
-        timestamps.append(ts.strftime("%Y-%m-%d %H:%M:%S"))
-        heart_rates.append(hr)
-
-    df = pd.DataFrame({
+    ts_index = pd.date_range(start=start_time, periods=minutes, freq="1min")
+    timestamps = ts_index.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+
+    # Baseline + mild sinusoidal variation + noise
+    noise = rng.normal(0, 3, minutes)
+    heart_rates = _synthesize_hr(noise, 72.0, 8.0, 15.0, 48.0, 180.0)
+
+    _write_csv(file_path, {
         "timestamp": timestamps,
         "heart_rate_bpm": heart_rates,
     })
-
-    _ensure_dir(file_path)
-    df.to_csv(file_path, index=False)
     return file_path
 
 
@@ -46,30 +107,22 @@ def create_steps_csv(file_path: str, minutes: int = 180, seed: Optional[int] = 1
     """
     rng = np.random.default_rng(seed)
     start_time = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
-    timestamps, steps, cadence = [], [], []
-
-    for i in range(minutes):
-        ts = start_time + timedelta(minutes=i)
-        # Simulate activity bursts: more steps during daytime windows
-        hour = ts.hour
-        lam = 2
-        if 8 <= hour < 10 or 12 <= hour < 14 or 17 <= hour < 19:
-            lam = 20
-        s = int(rng.poisson(lam))
-        # Cadence in steps per minute; if no steps, cadence 0
-        cad = s if s > 0 else 0
-        timestamps.append(ts.strftime("%Y-%m-%d %H:%M:%S"))
-        steps.append(s)
-        cadence.append(cad)
-
-    df = pd.DataFrame({
+    ts_index = pd.date_range(start=start_time, periods=minutes, freq="1min")
+    timestamps = ts_index.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+
+    # Simulate activity bursts: more steps during daytime windows
+    hours = ts_index.hour.to_numpy()
+    lam = np.full(minutes, 2)
+    lam[np.isin(hours, ACTIVE_HOURS)] = 20
+    steps = rng.poisson(lam).astype(np.int16)
+    # Cadence in steps per minute; if no steps, cadence 0
+    cadence = np.where(steps > 0, steps, 0)
+
+    _write_csv(file_path, {
         "timestamp": timestamps,
         "steps": steps,
         "cadence": cadence,
     })
-
-    _ensure_dir(file_path)
-    df.to_csv(file_path, index=False)
     return file_path
 
 
@@ -87,25 +140,21 @@ def create_sleep_csv(
                   - timedelta(days=1))
     n = int((duration_hours * 60) / interval_minutes)
 
-    stages = ["awake", "light", "deep", "REM"]
     probs = np.array([0.05, 0.55, 0.25, 0.15])
 
-    timestamps, stage_vals, durations = [], [], []
-    for i in range(n):
-        ts = start_time + timedelta(minutes=i * interval_minutes)
-        stage = rng.choice(stages, p=probs)
-        timestamps.append(ts.strftime("%Y-%m-%d %H:%M:%S"))
-        stage_vals.append(stage)
-        durations.append(interval_minutes)
+    ts_index = pd.date_range(start=start_time, periods=n, freq=f"{interval_minutes}min")
+    timestamps = ts_index.strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+    # Draw category codes directly; written through as a categorical column
+    stage_vals = pd.Categorical.from_codes(
+        rng.choice(len(SLEEP_STAGES), size=n, p=probs), categories=SLEEP_STAGES
+    )
+    durations = np.full(n, interval_minutes, dtype=np.int16)
 
-    df = pd.DataFrame({
+    _write_csv(file_path, {
         "timestamp": timestamps,
         "stage": stage_vals,
         "duration_min": durations,
     })
-
-    _ensure_dir(file_path)
-    df.to_csv(file_path, index=False)
     return file_path
 
 
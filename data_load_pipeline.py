@@ -1,5 +1,8 @@
 import argparse
-from typing import Dict, Literal, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Literal, Any
+
+import numpy as np
 
 try:
     import pandas as pd  # type: ignore
@@ -8,73 +11,92 @@ except Exception:
 
 from load_csv import load_all_csv
 from load_json import load_fitness_json
+from schema import Dataset, num_rows
 
 
 Prefer = Literal["csv", "json", "both"]
 
 
+# Empty tuple makes isinstance() always False when pandas is missing
+_DF_T = pd.DataFrame if pd is not None else ()
+
+
 def _is_dataframe(obj: Any) -> bool:
-    return pd is not None and str(type(obj)).endswith("DataFrame'>")
+    return isinstance(obj, _DF_T)
 
 
 def _is_empty(obj: Any) -> bool:
     if _is_dataframe(obj):
         return obj.empty
-    return not obj
+    return num_rows(obj) == 0
+
+
+def _column(ds: Dataset, name: str) -> np.ndarray:
+    if name in ds:
+        return ds[name]
+    return np.full(num_rows(ds), None, dtype=object)
+
+
+def _merge_sorted(a: Any, b: Any) -> Any:
+    """Union two time-ordered frames in linear time, keeping b's row on ties."""
+    out = pd.concat([a, b], ignore_index=True)
+    if a["timestamp"].iloc[-1] >= b["timestamp"].iloc[0]:
+        # Overlapping ranges: a stable sort (timsort) merges the two runs in one pass
+        out = out.sort_values("timestamp", kind="stable", ignore_index=True)
+    ts = out["timestamp"]
+    # Equal timestamps are now adjacent; keep the last row of each run and
+    # every row without a timestamp
+    return out[ts.ne(ts.shift(-1)) | ts.isna()].reset_index(drop=True)
 
 
 def _combine(csv_df: Any, json_df: Any) -> Any:
     """Combine two frames by union on rows and sort by timestamp.
 
     Assumes both frames already use aligned column names.
-    Drops exact duplicate rows; if a 'timestamp' column exists, sorts by it.
+    With a 'timestamp' column, one row is kept per timestamp (the JSON row on
+    conflict) and rows are sorted by it; otherwise DataFrames drop exact
+    duplicates. Works on DataFrames or, without pandas, on Datasets.
     """
     # Handle empties and types
-    if _is_dataframe(csv_df):
-        csv_empty = csv_df.empty
-    else:
-        csv_empty = not csv_df
-    if _is_dataframe(json_df):
-        json_empty = json_df.empty
-    else:
-        json_empty = not json_df
-
-    if csv_empty:
-        if _is_dataframe(json_df):
-            return json_df.copy()
-        return list(json_df) if json_df else ([] if pd is None else pd.DataFrame())
-    if json_empty:
-        if _is_dataframe(csv_df):
-            return csv_df.copy()
-        return list(csv_df)
+    if _is_empty(csv_df):
+        return json_df.copy() if _is_dataframe(json_df) else dict(json_df)
+    if _is_empty(json_df):
+        return csv_df.copy() if _is_dataframe(csv_df) else dict(csv_df)
 
     # Both have data
     if _is_dataframe(csv_df) and _is_dataframe(json_df):
         common_cols = sorted(set(csv_df.columns).union(set(json_df.columns)))
         a = csv_df.reindex(columns=common_cols)
         b = json_df.reindex(columns=common_cols)
-        out = pd.concat([a, b], ignore_index=True).drop_duplicates()
-        if "timestamp" in out.columns:
-            out = out.sort_values("timestamp").reset_index(drop=True)
-        return out
-
-    # List-of-dicts path
-    merged: List[Dict[str, Any]] = list(csv_df) + list(json_df)
-    # Drop exact duplicates
-    seen = set()
-    deduped: List[Dict[str, Any]] = []
-    for item in merged:
-        key = tuple(sorted(item.items()))
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(item)
-    # Sort by timestamp if present
+        if "timestamp" not in common_cols:
+            return pd.concat([a, b], ignore_index=True).drop_duplicates()
+        if a["timestamp"].is_monotonic_increasing and b["timestamp"].is_monotonic_increasing:
+            return _merge_sorted(a, b)
+        out = pd.concat([a, b], ignore_index=True)
+        # Unordered input: one row per timestamp with JSON winning ties, via a
+        # hash-based dedupe and then a stable sort. Missing timestamps are not
+        # duplicates of each other, so every NaT row is kept
+        ts = out["timestamp"]
+        out = out[~(ts.duplicated(keep="last") & ts.notna())]
+        return out.sort_values("timestamp", kind="mergesort", ignore_index=True)
+
+    # Dataset (dict of column arrays) path
+    names = list(dict.fromkeys([*csv_df, *json_df]))
+    merged: Dataset = {n: np.concatenate([_column(csv_df, n), _column(json_df, n)]) for n in names}
+    if "timestamp" not in merged:
+        return merged
+    ts = merged["timestamp"]
+    # Missing timestamps are not duplicates of each other: keep them all, last
+    nat = np.isnat(ts) if ts.dtype.kind == "M" else np.zeros(len(ts), dtype=bool)
+    valid = np.flatnonzero(~nat)
     try:
-        deduped.sort(key=lambda r: r.get("timestamp"))
-    except Exception:
-        pass
-    return deduped
+        # First hit in the reversed column is each timestamp's last row;
+        # np.unique also returns them in timestamp order
+        _, rev_idx = np.unique(ts[valid][::-1], return_index=True)
+    except TypeError:
+        return merged  # unorderable mix of parsed and unparsed timestamps
+    keep = np.concatenate([valid[len(valid) - 1 - rev_idx], np.flatnonzero(nat)])
+    return {n: col[keep] for n, col in merged.items()}
 
 
 def load_pipeline(
@@ -90,9 +112,13 @@ def load_pipeline(
     - prefer="json": use JSON data when present, otherwise fallback to CSV.
     - prefer="both": union CSV and JSON rows for each dataset.
     """
-    csv_data = load_all_csv(hr_csv, steps_csv, sleep_csv)
-    empty = (pd.DataFrame() if pd is not None else [])
-    json_data = load_fitness_json(json_path) if json_path else {"heart_rate": empty, "steps": empty, "sleep": empty}
+    empty = (pd.DataFrame() if pd is not None else {})
+    # The JSON load runs alongside the (themselves concurrent) CSV loads
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        csv_future = ex.submit(load_all_csv, hr_csv, steps_csv, sleep_csv)
+        json_future = ex.submit(load_fitness_json, json_path) if json_path else None
+        csv_data = csv_future.result()
+        json_data = json_future.result() if json_future else {"heart_rate": empty, "steps": empty, "sleep": empty}
 
     out: Dict[str, Any] = {}
     for key in ("heart_rate", "steps", "sleep"):
@@ -135,13 +161,13 @@ def main() -> None:
                     print(obj.head())
                     print(f"shape={obj.shape}")
             else:
-                if not obj:
+                rows = num_rows(obj)
+                if not rows:
                     print("  (empty)")
                 else:
-                    preview = obj[:5]
-                    for row in preview:
-                        print(row)
-                    print(f"rows={len(obj)}")
+                    for values in zip(*(col[:5].tolist() for col in obj.values())):
+                        print(dict(zip(obj, values)))
+                    print(f"rows={rows}")
 
         show("Heart Rate", frames["heart_rate"])
         show("Steps", frames["steps"]) 
@@ -1,93 +1,111 @@
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, Any
 import csv
-from datetime import datetime
+from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import pandas as pd  # type: ignore
 except Exception:  # pandas optional
     pd = None  # type: ignore
 
+try:
+    import pyarrow as pa  # type: ignore
+    from pyarrow import csv as pacsv  # type: ignore
+except Exception:  # pyarrow optional
+    pa = None  # type: ignore
 
-def load_heart_rate_csv(path: str):
-    """Load heart rate CSV with column 'timestamp' and 'heart_rate_bpm'.
+from parquet_cache import read_sidecar, write_sidecar
+from schema import as_stage_categorical, downcast, to_dataset
 
-    Returns a pandas DataFrame if pandas is available, otherwise a list of dicts.
-    """
-    if pd is not None:
+
+# Column dtypes per dataset ('timestamp' is always parsed as a datetime).
+# Aliases are understood by both pandas and pyarrow.type_for_alias. Integers
+# are parsed wide and narrowed afterwards by downcast() only when lossless.
+_TS_DTYPES: Dict[str, Dict[str, str]] = {
+    "heart_rate": {"heart_rate_bpm": "int64"},
+    "steps": {"steps": "int64", "cadence": "int64"},
+    "sleep": {"stage": "str", "duration_min": "int64"},
+}
+
+
+def _parse_frame(path: str, dtypes: Dict[str, str]):
+    """Parse a CSV into a DataFrame, or return None if it cannot be read."""
+    df = None
+    if pa is not None:
+        column_types = {"timestamp": pa.timestamp("ns")}
+        column_types.update({k: pa.type_for_alias(v) for k, v in dtypes.items()})
+        try:
+            table = pacsv.read_csv(
+                path, convert_options=pacsv.ConvertOptions(column_types=column_types)
+            )
+            df = table.to_pandas()
+        except Exception:
+            pass  # missing file or unparseable values; let pandas decide
+    if df is None:
         try:
-            df = pd.read_csv(path)
+            try:
+                df = pd.read_csv(path, dtype=dtypes, parse_dates=["timestamp"], cache_dates=True)
+            except ValueError:
+                # NA or fractions in an integer column, or no 'timestamp' column
+                df = pd.read_csv(path)
         except Exception:
-            return pd.DataFrame()
-        if "timestamp" in df.columns:
+            return None
+        if "timestamp" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
             df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    downcast(df)
+    if "stage" in df.columns:
+        df["stage"] = as_stage_categorical(df["stage"])
+    return df
+
+
+def _load_csv(path: str, dtypes: Dict[str, str]):
+    """Load a CSV with a 'timestamp' column plus the typed columns in `dtypes`.
+
+    With pandas and pyarrow available the file is parsed (timestamps included)
+    by pyarrow's multi-threaded reader; otherwise pandas or the built-in csv
+    module is used. Parsed frames are cached in a Parquet sidecar next to the
+    CSV and reused until the CSV changes.
+    Returns a pandas DataFrame if pandas is available, otherwise a Dataset
+    (dict of NumPy column arrays).
+    """
+    if pd is not None:
+        df = read_sidecar(path, key=repr(dtypes))
+        if df is None:
+            df = _parse_frame(path, dtypes)
+            if df is None:
+                return pd.DataFrame()
+            write_sidecar(path, df, key=repr(dtypes))
         return df
-    # Fallback: built-in csv
-    rows: List[Dict[str, Any]] = []
+    # Fallback: built-in csv, transposed straight into column arrays
     try:
         with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for r in reader:
-                if "timestamp" in r and r["timestamp"]:
-                    try:
-                        r["timestamp"] = datetime.fromisoformat(r["timestamp"])
-                    except Exception:
-                        pass
-                rows.append(r)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Skip blank lines and pad short rows with None, like csv.DictReader
+            rows = (row for row in reader if row)
+            columns = list(zip_longest(*rows, fillvalue=None))[: len(header)]
+            columns += [()] * (len(header) - len(columns))
     except Exception:
-        return []
-    return rows
+        return {}
+    return to_dataset(header, columns)
+
+
+def load_heart_rate_csv(path: str):
+    """Load heart rate CSV with column 'timestamp' and 'heart_rate_bpm'.
+
+    Returns a pandas DataFrame if pandas is available, otherwise a Dataset.
+    """
+    return _load_csv(path, _TS_DTYPES["heart_rate"])
 
 
 def load_steps_csv(path: str):
     """Load steps CSV with columns 'timestamp', 'steps', 'cadence'."""
-    if pd is not None:
-        try:
-            df = pd.read_csv(path)
-        except Exception:
-            return pd.DataFrame()
-        if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-        return df
-    rows: List[Dict[str, Any]] = []
-    try:
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for r in reader:
-                if "timestamp" in r and r["timestamp"]:
-                    try:
-                        r["timestamp"] = datetime.fromisoformat(r["timestamp"])
-                    except Exception:
-                        pass
-                rows.append(r)
-    except Exception:
-        return []
-    return rows
+    return _load_csv(path, _TS_DTYPES["steps"])
 
 
 def load_sleep_csv(path: str):
     """Load sleep CSV with columns 'timestamp', 'stage', 'duration_min'."""
-    if pd is not None:
-        try:
-            df = pd.read_csv(path)
-        except Exception:
-            return pd.DataFrame()
-        if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-        return df
-    rows: List[Dict[str, Any]] = []
-    try:
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for r in reader:
-                if "timestamp" in r and r["timestamp"]:
-                    try:
-                        r["timestamp"] = datetime.fromisoformat(r["timestamp"])
-                    except Exception:
-                        pass
-                rows.append(r)
-    except Exception:
-        return []
-    return rows
+    return _load_csv(path, _TS_DTYPES["sleep"])
 
 
 def load_all_csv(
@@ -95,21 +113,25 @@ def load_all_csv(
     steps_path: Optional[str] = None,
     sleep_path: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Load available CSVs and return a dict of DataFrames.
+    """Load available CSVs and return a dict of DataFrames (or Datasets).
 
     Keys: 'heart_rate', 'steps', 'sleep'
-    Missing files yield empty DataFrames.
+    Missing files yield empty DataFrames (or empty Datasets).
+    Files are read concurrently; the parsers release the GIL while working.
     """
-    empty = pd.DataFrame() if pd is not None else []
+    empty = pd.DataFrame() if pd is not None else {}
     data: Dict[str, Any] = {
         "heart_rate": empty,
         "steps": empty,
         "sleep": empty,
     }
-    if heart_rate_path:
-        data["heart_rate"] = load_heart_rate_csv(heart_rate_path)
-    if steps_path:
-        data["steps"] = load_steps_csv(steps_path)
-    if sleep_path:
-        data["sleep"] = load_sleep_csv(sleep_path)
+    paths = {
+        "heart_rate": heart_rate_path,
+        "steps": steps_path,
+        "sleep": sleep_path,
+    }
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = {k: ex.submit(_load_csv, p, _TS_DTYPES[k]) for k, p in paths.items() if p}
+        for k, fut in futures.items():
+            data[k] = fut.result()
     return data
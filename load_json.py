@@ -1,12 +1,151 @@
 import json
-from typing import Dict, Any, List
-from datetime import datetime
+import mmap
+from itertools import islice
+from typing import Dict, Any, Iterable, List
 
 try:
     import pandas as pd  # type: ignore
 except Exception:
     pd = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except Exception:  # orjson optional
+    orjson = None  # type: ignore
+
+try:
+    import simdjson  # type: ignore
+except Exception:  # pysimdjson optional
+    simdjson = None  # type: ignore
+
+from parquet_cache import read_sidecar, write_sidecar
+from schema import (
+    JSON_SECTIONS,
+    JSONL_SUFFIXES,
+    as_stage_categorical,
+    downcast,
+    rows_to_columns,
+    rows_to_dataset,
+)
+
+
+# Lines decoded per chunk when reading JSON Lines into DataFrames
+_JSONL_CHUNK_ROWS = 65_536
+
+
+def _empty_result() -> Dict[str, Any]:
+    empty = pd.DataFrame() if pd is not None else {}
+    return {"heart_rate": empty, "steps": empty, "sleep": empty}
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _read_document(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Parse a legacy single-object file into its per-dataset record lists."""
+    if simdjson is not None:
+        try:
+            # Document proxies are only valid while the parser lives: copy out here
+            doc = simdjson.Parser().load(path)
+            out: Dict[str, List[Dict[str, Any]]] = {}
+            for kind, section in JSON_SECTIONS.items():
+                records = doc.get(section)
+                out[kind] = records.as_list() if isinstance(records, simdjson.Array) else []
+            return out
+        except Exception:
+            pass  # e.g. NaN written by json.dump; let the parsers below decide
+    blob = None
+    if orjson is not None:
+        try:
+            # Parse straight from the mapped file instead of reading a copy first
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as buf:
+                    blob = orjson.loads(buf)
+        except Exception:
+            blob = None
+    if blob is None:
+        with open(path, "r", encoding="utf-8") as f:
+            blob = json.load(f)
+    return {kind: list(blob.get(section, [])) for kind, section in JSON_SECTIONS.items()}
+
+
+def _from_rows(
+    hr_list: List[Dict[str, Any]],
+    steps_list: List[Dict[str, Any]],
+    sleep_list: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    if pd is None:
+        return {
+            "heart_rate": rows_to_dataset(hr_list, rename={"bpm": "heart_rate_bpm"}),
+            "steps": rows_to_dataset(steps_list),
+            "sleep": rows_to_dataset(sleep_list),
+        }
+
+    # Column lists skip pandas' per-record schema inference
+    return _standardize(
+        pd.DataFrame(rows_to_columns(hr_list)),
+        pd.DataFrame(rows_to_columns(steps_list)),
+        pd.DataFrame(rows_to_columns(sleep_list)),
+    )
+
+
+def _standardize(hr: Any, steps: Any, sleep: Any) -> Dict[str, Any]:
+    """Align column names and types of the per-dataset frames in place."""
+    if "bpm" in hr.columns and "heart_rate_bpm" not in hr.columns:
+        hr.rename(columns={"bpm": "heart_rate_bpm"}, inplace=True)
+    for df in (hr, steps, sleep):
+        if not df.empty and "timestamp" in df.columns:
+            df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", errors="coerce", cache=True)
+        downcast(df)
+    if "stage" in sleep.columns:
+        sleep["stage"] = as_stage_categorical(sleep["stage"])
+
+    return {"heart_rate": hr, "steps": steps, "sleep": sleep}
+
+
+def _bucket_lines(lines: Iterable[bytes], rows: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Decode JSON Lines records into the per-kind lists of `rows`."""
+    for line in lines:
+        if not line.strip():
+            continue
+        r = _loads(line)
+        bucket = rows.get(r.pop("kind", None))
+        if bucket is not None:
+            bucket.append(r)
+
+
+def _load_fitness_jsonl(path: str) -> Dict[str, Any]:
+    """Load JSON Lines where every record carries a 'kind' of heart_rate/steps/sleep."""
+    rows: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in JSON_SECTIONS}
+    if pd is None:
+        try:
+            with open(path, "rb") as f:
+                _bucket_lines(f, rows)
+        except Exception:
+            return _empty_result()
+        return _from_rows(rows["heart_rate"], rows["steps"], rows["sleep"])
+
+    # Decode in bounded chunks of lines, keeping only each chunk's frames
+    frames: Dict[str, List[Any]] = {kind: [] for kind in JSON_SECTIONS}
+    try:
+        with open(path, "rb") as f:
+            while lines := list(islice(f, _JSONL_CHUNK_ROWS)):
+                _bucket_lines(lines, rows)
+                for kind, bucket in rows.items():
+                    if bucket:
+                        # Columns are the keys this kind's records carry, so an
+                        # all-null field is kept and other kinds' fields are not
+                        frames[kind].append(pd.DataFrame(rows_to_columns(bucket)))
+                        bucket.clear()
+    except Exception:
+        return _empty_result()
+    parts = {
+        kind: pd.concat(chunks, ignore_index=True).infer_objects() if chunks else pd.DataFrame()
+        for kind, chunks in frames.items()
+    }
+    return _standardize(parts["heart_rate"], parts["steps"], parts["sleep"])
+
 
 def load_fitness_json(path: str) -> Dict[str, Any]:
     """Load fitness JSON into standardized DataFrames.
@@ -16,56 +155,31 @@ def load_fitness_json(path: str) -> Dict[str, Any]:
     - step_data: [{timestamp, steps, cadence?}]
     - sleep_data: [{timestamp, stage, duration_min}]
 
-    Returns DataFrames with columns aligned to CSVs:
+    Paths ending in '.jsonl'/'.ndjson' are read as JSON Lines instead, one
+    record per line with a 'kind' field of 'heart_rate', 'steps' or 'sleep'.
+    Parsed frames are cached in Parquet sidecars ('<path>.<kind>.parquet').
+
+    Returns DataFrames (Datasets of NumPy column arrays without pandas) with
+    columns aligned to CSVs:
     - heart_rate: timestamp, heart_rate_bpm, confidence?
     - steps: timestamp, steps, cadence?
     - sleep: timestamp, stage, duration_min
     """
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            blob = json.load(f)
-    except Exception:
-        empty = pd.DataFrame() if pd is not None else []
-        return {"heart_rate": empty, "steps": empty, "sleep": empty}
-
-    hr_list: List[Dict[str, Any]] = list(blob.get("heart_rate_data", []))
-    steps_list: List[Dict[str, Any]] = list(blob.get("step_data", []))
-    sleep_list: List[Dict[str, Any]] = list(blob.get("sleep_data", []))
-
-    # Standardize columns and types
-    for r in hr_list:
-        if "bpm" in r and "heart_rate_bpm" not in r:
-            r["heart_rate_bpm"] = r.pop("bpm")
-        ts = r.get("timestamp")
-        if ts:
-            try:
-                r["timestamp"] = datetime.fromisoformat(ts)
-            except Exception:
-                pass
-    for r in steps_list:
-        ts = r.get("timestamp")
-        if ts:
-            try:
-                r["timestamp"] = datetime.fromisoformat(ts)
-            except Exception:
-                pass
-    for r in sleep_list:
-        ts = r.get("timestamp")
-        if ts:
-            try:
-                r["timestamp"] = datetime.fromisoformat(ts)
-            except Exception:
-                pass
+    if pd is not None:
+        cached = {kind: read_sidecar(path, f".{kind}") for kind in JSON_SECTIONS}
+        if all(df is not None for df in cached.values()):
+            return cached
 
-    if pd is None:
-        return {"heart_rate": hr_list, "steps": steps_list, "sleep": sleep_list}
+    if path.endswith(JSONL_SUFFIXES):
+        out = _load_fitness_jsonl(path)
+    else:
+        try:
+            rows = _read_document(path)
+        except Exception:
+            return _empty_result()
+        out = _from_rows(rows["heart_rate"], rows["steps"], rows["sleep"])
 
-    hr = pd.DataFrame(hr_list)
-    steps = pd.DataFrame(steps_list)
-    sleep = pd.DataFrame(sleep_list)
-
-    for df in (hr, steps, sleep):
-        if not df.empty and "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
-
-    return {"heart_rate": hr, "steps": steps, "sleep": sleep}
+    if pd is not None:
+        for kind, df in out.items():
+            write_sidecar(path, df, f".{kind}")
+    return out
@@ -0,0 +1,86 @@
+"""Parquet sidecar cache for parsed CSV/JSON sources.
+
+A sidecar sits next to its source (e.g. 'sample_steps.csv.parquet') and is
+used as long as the source still has the exact mtime and size it had when
+the sidecar was written, and the sidecar was written for the current
+column schema.
+"""
+import hashlib
+import os
+import tempfile
+from typing import Any, Optional
+
+try:
+    import pandas as pd  # type: ignore
+except Exception:
+    pd = None  # type: ignore
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:  # pyarrow optional
+    pa = None  # type: ignore
+
+from schema import NUMERIC_DTYPES, SLEEP_STAGES
+
+
+# Bump when the parsing changes in a way the schema below does not capture
+_CACHE_VERSION = 1
+_FINGERPRINT_KEY = b"fitpulse.schema"
+
+
+def sidecar_path(src: str, suffix: str = "") -> str:
+    return f"{src}{suffix}.parquet"
+
+
+def _fingerprint(src: str, key: str) -> bytes:
+    # The source's identity, not just its age: a file restored with an older
+    # mtime (cp -p, rsync -t, tar -x) must not match a newer sidecar
+    st = os.stat(src)
+    spec = repr((_CACHE_VERSION, sorted(NUMERIC_DTYPES.items()), SLEEP_STAGES, key,
+                 st.st_mtime_ns, st.st_size))
+    return hashlib.sha1(spec.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def read_sidecar(src: str, suffix: str = "", key: str = "") -> Optional[Any]:
+    """Return the cached DataFrame for `src`, or None if missing or stale.
+
+    `key` describes the caller's parse settings (e.g. its column dtypes); a
+    sidecar written for a different version of `src`, key or schema counts
+    as stale.
+    """
+    if pd is None or pa is None:
+        return None
+    pq_path = sidecar_path(src, suffix)
+    try:
+        metadata = pq.read_schema(pq_path).metadata or {}
+        if metadata.get(_FINGERPRINT_KEY) != _fingerprint(src, key):
+            return None
+        return pd.read_parquet(pq_path, engine="pyarrow")
+    except Exception:
+        return None
+
+
+def write_sidecar(src: str, data: Any, suffix: str = "", key: str = "") -> None:
+    """Cache `data` (an Arrow Table or DataFrame) for `src`; failures are ignored.
+
+    The sidecar is written to a temporary file and moved into place, so
+    readers never see a partially written file.
+    """
+    if pa is None or not os.path.exists(src):
+        return
+    pq_path = sidecar_path(src, suffix)
+    tmp_path = None
+    try:
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_FINGERPRINT_KEY] = _fingerprint(src, key)
+        table = table.replace_schema_metadata(metadata)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=os.path.basename(pq_path) + ".",
+                                        dir=os.path.dirname(pq_path) or ".")
+        os.close(fd)
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, pq_path)
+    except Exception:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
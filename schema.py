@@ -0,0 +1,155 @@
+"""Column types shared by the sample generators and the loaders."""
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    import pandas as pd  # type: ignore
+except Exception:
+    pd = None  # type: ignore
+
+
+# Fraction or offset marker after the 10-character date part of a timestamp
+_SUBSECOND_OR_OFFSET = re.compile(r"[.+Zz-]")
+
+# Column-oriented dataset (column name -> equal-length array), used for
+# datasets when pandas is unavailable
+Dataset = Dict[str, np.ndarray]
+
+SLEEP_STAGES: List[str] = ["awake", "light", "deep", "REM"]
+
+# Daytime windows with activity bursts: 08-10, 12-14 and 17-19
+ACTIVE_HOURS = np.array([8, 9, 12, 13, 17, 18])
+
+# Paths with these suffixes are read and written as JSON Lines
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+# Section of the legacy single-object JSON layout holding each dataset; the
+# dataset key doubles as the 'kind' field of JSON Lines records
+JSON_SECTIONS: Dict[str, str] = {"heart_rate": "heart_rate_data", "steps": "step_data", "sleep": "sleep_data"}
+
+# Narrowest dtypes covering each numeric column's value range
+NUMERIC_DTYPES: Dict[str, str] = {
+    "heart_rate_bpm": "int16",
+    "steps": "int16",
+    "cadence": "int16",
+    "duration_min": "int16",
+    "confidence": "float32",
+}
+
+
+def as_stage_categorical(stage: Any) -> Any:
+    """Convert a sleep-stage Series to a categorical over SLEEP_STAGES.
+
+    Unexpected labels are appended as extra categories rather than becoming NaN;
+    the Series is returned unchanged if its labels cannot form categories.
+    """
+    # key=str orders mixed-type labels (e.g. a stray numeric code) too
+    extra = sorted(set(stage.dropna().unique()) - set(SLEEP_STAGES), key=str)
+    try:
+        return stage.astype(pd.CategoricalDtype(SLEEP_STAGES + extra))
+    except (TypeError, ValueError):
+        return stage
+
+
+def fits_dtype(arr: np.ndarray, dtype: str) -> bool:
+    """Whether numeric `arr` casts to `dtype` without wrapping or truncation.
+
+    float32 targets are allowed to round; they only reject overflow.
+    """
+    target = np.dtype(dtype)
+    if arr.dtype.kind not in "iuf":
+        return False
+    if arr.size == 0:
+        return True
+    if target.kind in "iu":
+        if arr.dtype.kind == "f" and not (np.isfinite(arr).all() and (arr == np.trunc(arr)).all()):
+            return False
+        info = np.iinfo(target)
+        return bool(info.min <= arr.min() and arr.max() <= info.max)
+    finite = arr[np.isfinite(arr)]
+    return bool(finite.size == 0 or np.abs(finite).max() <= np.finfo(target).max)
+
+
+def downcast(df: Any) -> Any:
+    """Cast the known numeric columns of `df` to NUMERIC_DTYPES in place.
+
+    A column is only narrowed when fits_dtype() says no value would change;
+    columns with missing values keep their dtype for integer targets.
+    """
+    for col, dtype in NUMERIC_DTYPES.items():
+        if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        if fits_dtype(df[col].to_numpy(), dtype):
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def num_rows(ds: Dataset) -> int:
+    return len(next(iter(ds.values()))) if ds else 0
+
+
+def parse_timestamps(values: List[Any]) -> np.ndarray:
+    """Parse ISO-8601 timestamp strings into a datetime64[s] array.
+
+    Columns with fractional seconds or UTC offsets, which datetime64[s] would
+    truncate or silently shift to naive UTC, and batches NumPy rejects are
+    parsed with datetime.fromisoformat per value (into an object array)
+    instead, leaving values that do not parse unchanged.
+    """
+    if not any(isinstance(v, str) and _SUBSECOND_OR_OFFSET.search(v, 10) for v in values):
+        try:
+            return np.array(values, dtype="datetime64[s]")
+        except Exception:
+            pass  # bad values
+    out = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        try:
+            out[i] = datetime.fromisoformat(v) if v else v
+        except Exception:
+            out[i] = v
+    return out
+
+
+def column_array(name: str, values: List[Any]) -> np.ndarray:
+    """Build the array for column `name`, typed by the shared column schema."""
+    if name == "timestamp":
+        return parse_timestamps(values)
+    arr = np.array(values)
+    dtype = NUMERIC_DTYPES.get(name)
+    if dtype is None:
+        return arr
+    if arr.dtype.kind == "U":
+        # CSV text: parse wide first so the narrowing below can be checked
+        for wide in (np.int64, np.float64):
+            try:
+                arr = arr.astype(wide)
+                break
+            except (ValueError, OverflowError):
+                continue  # missing, fractional or non-numeric values
+    return arr.astype(dtype) if fits_dtype(arr, dtype) else arr
+
+
+def to_dataset(
+    columns: Iterable[str], values: Iterable[List[Any]], rename: Optional[Dict[str, str]] = None
+) -> Dataset:
+    """Assemble a Dataset from parallel column names and value lists."""
+    rename = rename or {}
+    names = list(columns)
+    # A rename never overwrites a column that is already present
+    targets = [n if rename.get(n, n) in names else rename[n] for n in names]
+    return {t: column_array(t, list(v)) for t, v in zip(targets, values)}
+
+
+def rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Pivot row dicts into one list per column; keys missing from a row become None."""
+    names = list(dict.fromkeys(k for r in rows for k in r))
+    return {n: [r.get(n) for r in rows] for n in names}
+
+
+def rows_to_dataset(rows: List[Dict[str, Any]], rename: Optional[Dict[str, str]] = None) -> Dataset:
+    """Transpose row dicts into a Dataset."""
+    columns = rows_to_columns(rows)
+    return to_dataset(columns, columns.values(), rename)